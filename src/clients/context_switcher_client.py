@@ -1,14 +1,22 @@
 """Context switcher API client for fetching task switching data."""
 
+import re
 import requests
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import json
 
+from ..utils import json_utils
+
 
 class ContextSwitcherClient:
     """Client for interacting with the context switcher API."""
     
+    # Date prefix of an ISO 8601 start_time
+    DATE_KEY_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+    
     def __init__(self, base_url: str = "http://127.0.0.1:5000"):
         """Initialize the context switcher client.
         
@@ -40,8 +48,8 @@ class ContextSwitcherClient:
         try:
             response = self.session.get(f"{self.base_url}/current")
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException:
+            return json_utils.loads(response.content)
+        except (requests.RequestException, ValueError):
             return None
     
     def get_recent_switches(self, days: int = 1) -> List[Dict[str, Any]]:
@@ -55,18 +63,18 @@ class ContextSwitcherClient:
         """
         try:
             # Calculate date range
-            end_date = datetime.now()
+            end_date = datetime.now().date()
             start_date = end_date - timedelta(days=days)
             
             params = {
-                'start_date': start_date.strftime('%Y-%m-%d'),
-                'end_date': end_date.strftime('%Y-%m-%d')
+                'start_date': start_date.isoformat(),
+                'end_date': end_date.isoformat()
             }
             
             response = self.session.get(f"{self.base_url}/switches/list", params=params)
             response.raise_for_status()
-            return response.json().get('switches', [])
-        except requests.RequestException:
+            return json_utils.loads(response.content).get('switches', [])
+        except (requests.RequestException, ValueError):
             return []
     
     def get_switch_counts(self, view: str = "week") -> Dict[str, Any]:
@@ -82,8 +90,8 @@ class ContextSwitcherClient:
             params = {'view': view}
             response = self.session.get(f"{self.base_url}/metrics/counts", params=params)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException:
+            return json_utils.loads(response.content)
+        except (requests.RequestException, ValueError):
             return {}
     
     def get_switch_leaders(self) -> List[Dict[str, Any]]:
@@ -95,15 +103,67 @@ class ContextSwitcherClient:
         try:
             response = self.session.get(f"{self.base_url}/analytics/switch-leaders")
             response.raise_for_status()
-            return response.json().get('leaders', [])
-        except requests.RequestException:
+            return json_utils.loads(response.content).get('leaders', [])
+        except (requests.RequestException, ValueError):
             return []
     
-    def format_switches_for_summary(self, switches: List[Dict[str, Any]]) -> str:
+    def get_bundle(self, days: int = 2, view: str = "week") -> Dict[str, Any]:
+        """Fetch recent switches, switch counts and the current task together.
+        
+        The three endpoints are independent, so they are requested
+        concurrently over the shared session.
+        
+        Args:
+            days: Number of days of switches to fetch
+            view: 'week' or 'month' view for switch counts
+            
+        Returns:
+            Dictionary with 'recent_switches', 'switch_counts' and
+            'current_task' keys
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            recent_future = executor.submit(self.get_recent_switches, days=days)
+            counts_future = executor.submit(self.get_switch_counts, view=view)
+            current_future = executor.submit(self.get_current_task)
+        
+        return {
+            'recent_switches': recent_future.result(),
+            'switch_counts': counts_future.result(),
+            'current_task': current_future.result()
+        }
+    
+    def _group_switches_by_date(
+        self, switches: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Group switch entries by the date of their start time.
+        
+        Args:
+            switches: List of switch entries
+            
+        Returns:
+            Mapping of 'YYYY-MM-DD' (or 'unknown') to switch entries
+        """
+        # start_time is ISO 8601, so the date is simply its first 10
+        # characters; anything else is grouped under 'unknown'
+        switches_by_date = defaultdict(list)
+        for switch in switches:
+            start_time = switch.get('start_time')
+            date_key = start_time[:10] if isinstance(start_time, str) else ''
+            if not self.DATE_KEY_PATTERN.fullmatch(date_key):
+                date_key = 'unknown'
+            switches_by_date[date_key].append(switch)
+        return switches_by_date
+    
+    def format_switches_for_summary(
+        self,
+        switches: List[Dict[str, Any]],
+        switches_by_date: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ) -> str:
         """Format switch data for standup summary.
         
         Args:
             switches: List of switch entries
+            switches_by_date: Optional switches already grouped by date
             
         Returns:
             Formatted string for summary
@@ -111,34 +171,18 @@ class ContextSwitcherClient:
         if not switches:
             return "No context switching data available."
         
-        # Group switches by date
-        switches_by_date = {}
+        if switches_by_date is None:
+            switches_by_date = self._group_switches_by_date(switches)
         total_switches = len(switches)
         
-        for switch in switches:
-            # Parse the start_time (assuming it's in ISO format)
-            try:
-                if switch.get('start_time'):
-                    start_time = datetime.fromisoformat(switch['start_time'].replace('Z', '+00:00'))
-                    date_key = start_time.strftime('%Y-%m-%d')
-                else:
-                    date_key = 'unknown'
-                
-                if date_key not in switches_by_date:
-                    switches_by_date[date_key] = []
-                switches_by_date[date_key].append(switch)
-            except (ValueError, TypeError):
-                # Skip invalid timestamps
-                continue
-        
         # Build summary
-        summary = f"Context Switching Summary ({total_switches} total switches):\n"
+        lines = [f"Context Switching Summary ({total_switches} total switches):"]
         
         for date, date_switches in sorted(switches_by_date.items()):
             if date == 'unknown':
                 continue
                 
-            summary += f"\n{date} ({len(date_switches)} switches):\n"
+            lines.append(f"\n{date} ({len(date_switches)} switches):")
             
             for switch in date_switches:
                 task = switch.get('task', 'Unknown task')
@@ -148,17 +192,17 @@ class ContextSwitcherClient:
                 
                 duration_str = f"{duration}min" if duration > 0 else "ongoing"
                 
-                summary += f"  • {task} ({duration_str})"
+                line = [f"  • {task} ({duration_str})"]
                 
                 if tags:
-                    summary += f" [{', '.join(tags)}]"
+                    line.append(f" [{', '.join(tags)}]")
                 
                 if notes:
-                    summary += f" - {notes[:100]}{'...' if len(notes) > 100 else ''}"
+                    line.append(f" - {notes[:100]}{'...' if len(notes) > 100 else ''}")
                 
-                summary += "\n"
+                lines.append("".join(line))
         
-        return summary
+        return "\n".join(lines) + "\n"
     
     def get_productivity_metrics(self) -> str:
         """Get productivity metrics including switch counts and patterns.
@@ -167,14 +211,10 @@ class ContextSwitcherClient:
             Formatted productivity metrics string
         """
         try:
-            # Get recent switches
-            recent_switches = self.get_recent_switches(days=2)
-            
-            # Get switch counts
-            switch_counts = self.get_switch_counts(view="week")
-            
-            # Get current task
-            current_task = self.get_current_task()
+            bundle = self.get_bundle(days=2, view="week")
+            recent_switches = bundle['recent_switches']
+            switch_counts = bundle['switch_counts']
+            current_task = bundle['current_task']
             
             # Build metrics summary
             metrics = "Context Switching Productivity Metrics:\n"
@@ -186,17 +226,21 @@ class ContextSwitcherClient:
                 metrics += f"Total switches this week: {switch_counts['total_switches_this_week']}\n"
             
             if recent_switches:
-                today_switches = [s for s in recent_switches 
-                                if s.get('start_time', '').startswith(datetime.now().strftime('%Y-%m-%d'))]
-                yesterday_switches = [s for s in recent_switches 
-                                    if s.get('start_time', '').startswith((datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d'))]
+                switches_by_date = self._group_switches_by_date(recent_switches)
+                today = datetime.now().date()
+                today_str = today.isoformat()
+                yesterday_str = (today - timedelta(days=1)).isoformat()
                 
-                metrics += f"Switches today: {len(today_switches)}\n"
-                metrics += f"Switches yesterday: {len(yesterday_switches)}\n"
-            
-            # Add switch details
-            if recent_switches:
-                metrics += "\n" + self.format_switches_for_summary(recent_switches)
+                today_count = len(switches_by_date.get(today_str, ()))
+                yesterday_count = len(switches_by_date.get(yesterday_str, ()))
+                
+                metrics += f"Switches today: {today_count}\n"
+                metrics += f"Switches yesterday: {yesterday_count}\n"
+                
+                # Add switch details
+                metrics += "\n" + self.format_switches_for_summary(
+                    recent_switches, switches_by_date
+                )
             
             return metrics
             
@@ -3,26 +3,64 @@
 import jwt
 import requests
 import time
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
+from ..utils import json_utils
+from ..utils.cache import DiskCache
+
 
 class GitHubClient:
     """Client for interacting with GitHub API using GitHub App authentication."""
     
-    def __init__(self, app_id: str, installation_id: str, private_key_path: str):
+    # Seconds to reuse cached results across runs
+    EVENTS_TTL = 300
+    TOKEN_TTL = 55 * 60  # Installation tokens live for an hour
+    
+    def __init__(
+        self,
+        app_id: str,
+        installation_id: str,
+        private_key_path: str,
+        cache: Optional[DiskCache] = None
+    ):
         """Initialize GitHub client.
         
         Args:
             app_id: GitHub App ID
             installation_id: GitHub App Installation ID
             private_key_path: Path to the private key file
+            cache: Optional disk cache for tokens and events
         """
         self.app_id = app_id
         self.installation_id = installation_id
         self.private_key_path = private_key_path
-        self._access_token = None
-        self._token_expires_at = None
+        self.cache = cache
+        
+        # Parse the PEM once; PyJWT signs directly with the loaded key object
+        with open(private_key_path, "rb") as key_file:
+            private_key = serialization.load_pem_private_key(
+                key_file.read(), password=None
+            )
+        # GitHub App keys are RSA and the JWT is signed with RS256
+        if not isinstance(private_key, RSAPrivateKey):
+            raise ValueError(
+                f"GitHub App private key must be an RSA key: {private_key_path}"
+            )
+        self._private_key = private_key
+        # PyJWT >= 2.10 requires a string issuer, even for numeric App IDs
+        self._jwt_issuer = str(app_id)
+        self._access_token: Optional[str] = None
+        self._token_expires_at: Optional[datetime] = None
+        self._jwt_token: Optional[str] = None
+        self._jwt_expires_at = 0
+        
+        # Reuse connections across the token and events calls
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
     
     def _generate_jwt(self) -> str:
         """Generate a JWT for GitHub App authentication.
@@ -30,16 +68,18 @@ class GitHubClient:
         Returns:
             JWT token string
         """
-        with open(self.private_key_path, "r") as key_file:
-            private_key = key_file.read()
-        
+        now = int(time.time())
+        expires_at = now + (10 * 60)  # 10 minutes
         payload = {
-            "iat": int(time.time()),
-            "exp": int(time.time()) + (10 * 60),  # 10 minutes
-            "iss": self.app_id
+            "iat": now,
+            "exp": expires_at,
+            "iss": self._jwt_issuer
         }
         
-        return jwt.encode(payload, private_key, algorithm="RS256")
+        token = jwt.encode(payload, self._private_key, algorithm="RS256")
+        self._jwt_token = token
+        self._jwt_expires_at = expires_at
+        return token
     
     def _get_access_token(self) -> Optional[str]:
         """Get installation access token.
@@ -52,19 +92,41 @@ class GitHubClient:
             datetime.now() < self._token_expires_at - timedelta(minutes=5)):
             return self._access_token
         
-        jwt_token = self._generate_jwt()
+        # Reuse a token minted by an earlier run if it is still valid
+        token_cache_key = f"github:token:{self.installation_id}"
+        if self.cache:
+            cached = self.cache.get(token_cache_key)
+            if cached:
+                self._access_token = cached["token"]
+                self._token_expires_at = datetime.fromtimestamp(cached["expires_at"])
+                return self._access_token
+        
+        # A JWT is valid for 10 minutes, so reuse it rather than re-signing
+        if self._jwt_token and time.time() < self._jwt_expires_at - 60:
+            jwt_token = self._jwt_token
+        else:
+            jwt_token = self._generate_jwt()
         url = f"https://api.github.com/app/installations/{self.installation_id}/access_tokens"
         headers = {
             "Authorization": f"Bearer {jwt_token}",
             "Accept": "application/vnd.github+json"
         }
         
-        response = requests.post(url, headers=headers)
+        response = self.session.post(url, headers=headers)
         if response.status_code == 201:
             data = response.json()
             self._access_token = data["token"]
             # GitHub tokens expire in 1 hour
             self._token_expires_at = datetime.now() + timedelta(hours=1)
+            if self.cache:
+                self.cache.set(
+                    token_cache_key,
+                    {
+                        "token": self._access_token,
+                        "expires_at": self._token_expires_at.timestamp()
+                    },
+                    expire=self.TOKEN_TTL
+                )
             return self._access_token
         else:
             print(f"Failed to get access token: {response.status_code} - {response.text}")
@@ -80,6 +142,12 @@ class GitHubClient:
         Returns:
             List of event dictionaries
         """
+        events_cache_key = f"github:events:{username}:{org or ''}"
+        if self.cache:
+            cached_events: Optional[List[Dict]] = self.cache.get(events_cache_key)
+            if cached_events is not None:
+                return cached_events
+        
         access_token = self._get_access_token()
         if not access_token:
             return []
@@ -89,17 +157,39 @@ class GitHubClient:
             "Authorization": f"Bearer {access_token}"
         }
         
+        # Revalidate the last response with its ETag; a 304 has no body and
+        # does not count against the rate limit
+        etag_cache_key = f"github:events-etag:{username}:{org or ''}"
+        previous = self.cache.get(etag_cache_key) if self.cache else None
+        if previous:
+            headers["If-None-Match"] = previous["etag"]
+        
         if org:
             url = f"https://api.github.com/users/{username}/events/orgs/{org}"
         else:
             url = f"https://api.github.com/users/{username}/events"
         
-        response = requests.get(url, headers=headers)
-        if response.status_code != 200:
+        response = self.session.get(url, headers=headers)
+        if response.status_code == 304 and previous:
+            events = previous["events"]
+        elif response.status_code == 200:
+            events = json_utils.loads(response.content)
+            # The feed can repeat events; keep the first of each id, in order
+            unique_events: Dict = {}
+            for index, event in enumerate(events):
+                unique_events.setdefault(event.get("id", index), event)
+            events = list(unique_events.values())
+            etag = response.headers.get("ETag")
+            if self.cache and etag:
+                self.cache.set(etag_cache_key, {"etag": etag, "events": events})
+        else:
             print(f"Failed to fetch events: {response.status_code} - {response.text}")
             return []
         
-        return response.json()
+        if self.cache:
+            self.cache.set(events_cache_key, events, expire=self.EVENTS_TTL)
+        
+        return events
     
     def filter_recent_events(self, events: List[Dict], days: int = 2) -> List[Dict]:
         """Filter events to only include recent ones.
@@ -111,18 +201,15 @@ class GitHubClient:
         Returns:
             Filtered list of recent events
         """
-        cutoff_date = datetime.now().date() - timedelta(days=days-1)
+        # created_at is "YYYY-MM-DDTHH:MM:SSZ", so ISO date prefixes compare
+        # correctly as plain strings without parsing each timestamp
+        cutoff_str = (datetime.now().date() - timedelta(days=days-1)).isoformat()
         recent_events = []
         
         for event in events:
-            try:
-                event_date = datetime.strptime(
-                    event["created_at"], "%Y-%m-%dT%H:%M:%SZ"
-                ).date()
-                if event_date >= cutoff_date:
-                    recent_events.append(event)
-            except (ValueError, KeyError):
-                continue
+            created_at = event.get("created_at")
+            if isinstance(created_at, str) and created_at[:10] >= cutoff_str:
+                recent_events.append(event)
         
         return recent_events
     
@@ -138,12 +225,10 @@ class GitHubClient:
         if not events:
             return "No GitHub events found for the recent days."
         
-        event_info = "Recent GitHub Events:\n"
-        for event in events:
-            event_type = event.get("type", "Unknown")
-            repo_name = event.get("repo", {}).get("name", "Unknown repo")
-            event_time = event.get("created_at", "Unknown time")
-            
-            event_info += f"- {event_type} on {repo_name} at {event_time}\n"
-        
-        return event_info
\ No newline at end of file
+        lines = "\n".join(
+            f"- {event.get('type', 'Unknown')}"
+            f" on {event.get('repo', {}).get('name', 'Unknown repo')}"
+            f" at {event.get('created_at', 'Unknown time')}"
+            for event in events
+        )
+        return f"Recent GitHub Events:\n{lines}\n"
\ No newline at end of file
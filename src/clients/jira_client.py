@@ -1,31 +1,53 @@
 """Jira API client for fetching tickets and project information."""
 
-import json
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
+
+from ..utils import json_utils
+from ..utils.cache import DiskCache
 
 
 class JiraClient:
     """Client for interacting with Jira API."""
     
-    def __init__(self, domain: str, email: str, api_key: str):
+    # Seconds to reuse cached active-ticket results across runs
+    ACTIVE_TICKETS_TTL = 300
+    
+    def __init__(
+        self,
+        domain: str,
+        email: str,
+        api_key: str,
+        cache: Optional[DiskCache] = None
+    ):
         """Initialize Jira client.
         
         Args:
             domain: Jira domain (e.g., 'company.atlassian.net')
             email: User email for authentication
             api_key: Jira API key
+            cache: Optional disk cache for search results
         """
         self.domain = domain
         self.email = email
         self.api_key = api_key
+        self.cache = cache
         self.base_url = f"https://{domain}/rest/api/3"
         self.auth = HTTPBasicAuth(email, api_key)
         self.headers = {
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        
+        # Persistent session so repeated searches share one keep-alive connection
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update(self.headers)
+        # Size the pool so concurrent callers reuse connections instead of
+        # opening (and discarding) extra ones
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
     
     def search_issues(
         self,
@@ -35,10 +57,14 @@ class JiraClient:
     ) -> List[Dict]:
         """Search for issues using JQL.
         
+        Uses the ``search/jql`` endpoint and follows its ``nextPageToken``
+        pagination over the shared session until every matching issue has
+        been collected.
+        
         Args:
             jql: JQL query string
             fields: List of fields to retrieve
-            max_results: Maximum number of results
+            max_results: Page size requested from the API
             
         Returns:
             List of issue dictionaries
@@ -47,24 +73,29 @@ class JiraClient:
             requests.RequestException: If the API request fails
         """
         if fields is None:
-            fields = ["summary", "status", "key"]
+            fields = ["summary", "status"]
         
-        url = f"{self.base_url}/search"
-        payload = {
+        url = f"{self.base_url}/search/jql"
+        payload: Dict[str, Any] = {
             "jql": jql,
             "fields": fields,
             "maxResults": max_results
         }
         
-        response = requests.post(
-            url,
-            data=json.dumps(payload),
-            headers=self.headers,
-            auth=self.auth
-        )
-        response.raise_for_status()
+        issues: List[Dict] = []
+        while True:
+            response = self.session.post(url, json=payload)
+            response.raise_for_status()
+            
+            data = json_utils.loads(response.content)
+            issues.extend(data.get("issues", []))
+            
+            next_page_token = data.get("nextPageToken")
+            if not next_page_token or data.get("isLast"):
+                break
+            payload["nextPageToken"] = next_page_token
         
-        return response.json().get("issues", [])
+        return issues
     
     def get_my_active_tickets(self) -> List[Dict]:
         """Get active tickets assigned to the current user.
@@ -73,7 +104,20 @@ class JiraClient:
             List of active ticket dictionaries
         """
         jql = 'assignee = currentUser() AND status in ("To Do", "In Progress", "On Hold") ORDER BY priority DESC'
-        return self.search_issues(jql)
+        
+        cache_key = f"jira:active:{self.domain}:{self.email}:{jql}"
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # "key" is always returned at the top level of each issue
+        tickets = self.search_issues(jql, fields=["summary", "status"])
+        
+        if self.cache:
+            self.cache.set(cache_key, tickets, expire=self.ACTIVE_TICKETS_TTL)
+        
+        return tickets
     
     def format_tickets_for_summary(self, tickets: List[Dict]) -> str:
         """Format tickets for inclusion in summary.
@@ -87,13 +131,25 @@ class JiraClient:
         if not tickets:
             return "No tickets found."
         
-        ticket_info = "Take into account these tickets:\n"
-        for ticket in tickets:
-            key = ticket.get("key", "Unknown")
-            fields = ticket.get("fields", {})
-            summary = fields.get("summary", "No summary available")
-            status = fields.get("status", {}).get("name", "No status available")
-            
-            ticket_info += f"- {key} ({status}): {summary}\n"
+        lines = "\n".join(
+            self._format_ticket_line(
+                ticket.get("key", "Unknown"), ticket.get("fields", {})
+            )
+            for ticket in tickets
+        )
+        return f"Take into account these tickets:\n{lines}\n"
+    
+    @staticmethod
+    def _format_ticket_line(key: str, fields: Dict) -> str:
+        """Format a single ticket as a summary bullet.
         
-        return ticket_info
\ No newline at end of file
+        Args:
+            key: Ticket key
+            fields: Ticket fields dictionary
+            
+        Returns:
+            Formatted ticket line
+        """
+        summary = fields.get("summary", "No summary available")
+        status = fields.get("status", {}).get("name", "No status available")
+        return f"- {key} ({status}): {summary}"
\ No newline at end of file
@@ -3,6 +3,7 @@
 import configparser
 import json
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -44,12 +45,13 @@ class Config:
             env_file: Path to the .env file
         """
         try:
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        os.environ[key] = value
+            stripped = (line.strip() for line in env_file.read_text().splitlines())
+            values = dict(
+                line.split('=', 1)
+                for line in stripped
+                if line and not line.startswith('#') and '=' in line
+            )
+            os.environ.update(values)
         except Exception as e:
             # Don't fail if secrets file can't be loaded
             pass
@@ -75,27 +77,27 @@ class Config:
         
         raise ValueError(f"Secret '{key}' not found in environment variables or config")
     
-    @property
+    @cached_property
     def project_id(self) -> str:
         """Google Cloud project ID."""
         return self._config.get("settings", "PROJECT_ID")
     
-    @property
+    @cached_property
     def location(self) -> str:
         """Google Cloud location."""
         return self._config.get("settings", "LOCATION")
     
-    @property
+    @cached_property
     def jira_domain(self) -> str:
         """Jira domain."""
         return self._config.get("settings", "JIRA_DOMAIN")
     
-    @property
+    @cached_property
     def email(self) -> str:
         """User email."""
         return self._config.get("settings", "EMAIL")
     
-    @property
+    @cached_property
     def jira_api_key(self) -> str:
         """Jira API key."""
         return self._get_secret(
@@ -103,22 +105,22 @@ class Config:
             self._config.get("settings", "JIRA_API_KEY", fallback=None)
         )
     
-    @property
+    @cached_property
     def git_author(self) -> str:
         """Git author name."""
         return self._config.get("settings", "GIT_AUTHOR")
     
-    @property
+    @cached_property
     def github_app_id(self) -> Optional[str]:
         """GitHub App ID."""
         return self._config.get("settings", "GITHUB_APP_ID", fallback=None)
     
-    @property
+    @cached_property
     def github_installation_id(self) -> Optional[str]:
         """GitHub Installation ID."""
         return self._config.get("settings", "GITHUB_INSTALLATION_ID", fallback=None)
     
-    @property
+    @cached_property
     def private_key_path(self) -> Optional[str]:
         """Path to GitHub App private key."""
         try:
@@ -129,47 +131,60 @@ class Config:
         except ValueError:
             return None
     
-    @property
+    @cached_property
     def github_username(self) -> Optional[str]:
         """GitHub username."""
         return self._config.get("settings", "GITHUB_USERNAME", fallback=None)
     
-    @property
+    @cached_property
     def notes_directory(self) -> Path:
         """Directory containing work notes."""
         return Path(self._config.get("paths", "NOTES_DIRECTORY"))
     
-    @property
+    @cached_property
     def output_directory(self) -> Path:
         """Output directory for summaries."""
         return Path(self._config.get("paths", "OUTPUT_DIRECTORY"))
     
-    @property
+    @cached_property
+    def cache_directory(self) -> Path:
+        """Directory for cached API responses and tokens."""
+        directory = self._config.get(
+            "paths", "CACHE_DIRECTORY", fallback="~/.cache/standup-helper"
+        )
+        return Path(directory).expanduser()
+    
+    @cached_property
     def git_directories(self) -> List[str]:
         """List of Git directories to monitor."""
         return json.loads(self._config.get("paths", "GIT_DIRECTORIES"))
     
-    @property
+    @cached_property
     def vertex_instruction(self) -> str:
         """Vertex AI instruction prompt."""
         return self._config.get("vertex", "INSTRUCTION")
     
-    @property
+    @cached_property
     def vertex_model(self) -> str:
         """Vertex AI model name."""
         return self._config.get("vertex", "MODEL")
     
-    @property
+    @cached_property
+    def vertex_compress_prompt(self) -> bool:
+        """Whether to abbreviate repeated terms in the prompt content."""
+        return self._config.getboolean("vertex", "COMPRESS_PROMPT", fallback=False)
+    
+    @cached_property
     def context_switcher_enabled(self) -> bool:
         """Whether context switcher integration is enabled."""
         return self._config.getboolean("context_switcher", "ENABLED", fallback=False)
     
-    @property
+    @cached_property
     def context_switcher_url(self) -> str:
         """Context switcher API URL."""
         return self._config.get("context_switcher", "URL", fallback="http://127.0.0.1:5000")
     
-    @property
+    @cached_property
     def context_switcher_days_back(self) -> int:
         """Number of days to look back for context switching data."""
         return self._config.getint("context_switcher", "DAYS_BACK", fallback=2)
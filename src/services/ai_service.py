@@ -1,27 +1,52 @@
 """Vertex AI service for generating summaries and content."""
 
-import vertexai
-from vertexai.generative_models import GenerativeModel
-from typing import Optional
+import re
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from .data_preprocessor import DataPreprocessor
 
 
 class AIService:
     """Service for interacting with Vertex AI."""
     
-    def __init__(self, project_id: str, location: str, model_name: str = "gemini-2.5-flash"):
+    # Prompt abbreviation settings (see compress_content)
+    ABBREVIATION_MAX_TERMS = 16
+    ABBREVIATION_MIN_LENGTH = 6
+    ABBREVIATION_MARKER = "§"
+    # Words with surrounding punctuation stripped; hyphenated words and
+    # ticket IDs such as INFRA-1234 stay whole
+    WORD_PATTERN = re.compile(r'\w+(?:-\w+)*')
+    
+    def __init__(
+        self,
+        project_id: str,
+        location: str,
+        model_name: str = "gemini-2.5-flash",
+        compress_prompt: bool = False
+    ):
         """Initialize AI service.
         
         Args:
             project_id: Google Cloud project ID
             location: Google Cloud location
             model_name: Vertex AI model name
+            compress_prompt: Whether to abbreviate repeated terms in the content
         """
         self.project_id = project_id
         self.location = location
         self.model_name = model_name
+        self.compress_prompt = compress_prompt
+        
+        # Imported lazily: the Vertex SDK is heavy and only needed once an
+        # AIService is actually constructed
+        import vertexai
+        from vertexai.generative_models import GenerativeModel
         
         vertexai.init(project=project_id, location=location)
         self.model = GenerativeModel(model_name)
+        # Local tokenizer for compress_content, loaded on first use
+        self._tokenizer: Any = None
     
     def generate_summary(self, content: str, instruction: str) -> Optional[str]:
         """Generate a summary using Vertex AI.
@@ -34,6 +59,8 @@ class AIService:
             Generated summary or None if failed
         """
         try:
+            if self.compress_prompt:
+                content = self.compress_content(content)
             full_prompt = f"{instruction}\n\n{content}"
             response = self.model.generate_content(full_prompt)
             return response.text.strip()
@@ -41,6 +68,84 @@ class AIService:
             print(f"Error during Vertex AI summarization: {e}")
             return None
     
+    def compress_content(self, content: str) -> str:
+        """Abbreviate frequently repeated words to reduce prompt tokens.
+        
+        The most common long words are replaced with short markers (§1, §2,
+        ...) and a legend is prepended so the model can expand them. Words
+        are counted with surrounding punctuation stripped, ticket IDs are
+        never abbreviated, and the result is only used when the model's
+        tokenizer confirms it is actually cheaper than the original.
+        
+        Args:
+            content: Content to compress
+            
+        Returns:
+            Compressed content with legend, or the original content if
+            nothing is worth abbreviating
+        """
+        if self.ABBREVIATION_MARKER in content:
+            return content
+        
+        counts = Counter(
+            word for word in self.WORD_PATTERN.findall(content)
+            if len(word) >= self.ABBREVIATION_MIN_LENGTH
+            and not DataPreprocessor.TICKET_PATTERN_ANY_CASE.fullmatch(word)
+        )
+        
+        # Character savings are only a cheap first filter for candidates
+        abbreviations: Dict[str, str] = {}
+        for word, count in counts.most_common():
+            if len(abbreviations) >= self.ABBREVIATION_MAX_TERMS:
+                break
+            marker = f"{self.ABBREVIATION_MARKER}{len(abbreviations) + 1}"
+            legend_cost = len(marker) + len(word) + 2
+            if count * (len(word) - len(marker)) > legend_cost:
+                abbreviations[word] = marker
+        
+        if not abbreviations:
+            return content
+        
+        # Longest words first so a shorter word never pre-empts a longer one;
+        # the lookarounds keep parts of hyphenated words and IDs intact
+        longest_first = sorted(abbreviations, key=len, reverse=True)
+        pattern = re.compile(
+            r'(?<![\w-])('
+            + '|'.join(re.escape(w) for w in longest_first)
+            + r')(?![\w-])'
+        )
+        compressed = pattern.sub(lambda m: abbreviations[m.group(1)], content)
+        
+        legend = ", ".join(f"{marker}={word}" for word, marker in abbreviations.items())
+        compressed = f"Abbreviations used below: {legend}\n\n{compressed}"
+        
+        # Markers and the legend can tokenize worse than they look, so let
+        # the model's tokenizer decide whether anything was saved
+        try:
+            original_tokens = self._count_tokens(content)
+            compressed_tokens = self._count_tokens(compressed)
+        except Exception as e:
+            print(f"Error counting tokens, sending uncompressed prompt: {e}")
+            return content
+        if compressed_tokens >= original_tokens:
+            return content
+        return compressed
+    
+    def _count_tokens(self, text: str) -> int:
+        """Count prompt tokens locally, without a round trip to Vertex AI.
+        
+        Args:
+            text: Text to count
+            
+        Returns:
+            Number of tokens the model's tokenizer produces for the text
+        """
+        if self._tokenizer is None:
+            from vertexai.preview.tokenization import get_tokenizer_for_model
+            
+            self._tokenizer = get_tokenizer_for_model(self.model_name)
+        return int(self._tokenizer.count_tokens(text).total_tokens)
+    
     def generate_standup_summary(self, content: str, instruction: str) -> Optional[str]:
         """Generate a standup-specific summary.
         
@@ -1,20 +1,103 @@
 """Data aggregation service for collecting information from multiple sources."""
 
+import functools
 import os
+import re
 import subprocess
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
+
+try:
+    import pygit2
+    from pygit2.enums import SortMode
+except ImportError:  # pygit2 is an optional speedup; fall back to the git CLI
+    pygit2 = None  # type: ignore[assignment]
 
 from ..clients.jira_client import JiraClient
 from ..clients.github_client import GitHubClient
 from ..clients.context_switcher_client import ContextSwitcherClient
 from .data_preprocessor import DataPreprocessor
 
+# "since" values understood without shelling out to git (e.g. "2 days ago")
+_RELATIVE_SINCE_RE = re.compile(r'^\s*(\d+)\s+(minute|hour|day|week)s?\s+ago\s*$')
+_SINCE_UNITS = {"minute": 60, "hour": 3600, "day": 86400, "week": 604800}
+
+
+def _author_pattern(author: str) -> "re.Pattern[str]":
+    """Translate a git ``--author`` basic regular expression to Python.
+    
+    Only ``.``, ``*`` and the ``^``/``$`` anchors are special; everything
+    else, including ``+ ? | ( ) { }``, matches literally as it does in a
+    basic regex.
+    
+    Args:
+        author: Git author pattern
+        
+    Returns:
+        Compiled pattern matching what git would match
+        
+    Raises:
+        ValueError: If the pattern uses escapes or bracket expressions,
+            which are left to git itself
+    """
+    if "\\" in author or "[" in author:
+        raise ValueError(f"Author pattern needs git's regex engine: {author}")
+    
+    anchors = (("^", 0), ("$", len(author) - 1))
+    parts: List[str] = []
+    for index, char in enumerate(author):
+        # A leading "*" (or one right after "^") is literal in a basic regex
+        repeats = char == "*" and bool(parts) and parts[-1] != "^"
+        if char == "." or repeats or (char, index) in anchors:
+            parts.append(char)
+        else:
+            parts.append(re.escape(char))
+    return re.compile("".join(parts))
+
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _memoize_per_run(method: _Method) -> _Method:
+    """Reuse a method's result for the same arguments within RESULT_CACHE_TTL.
+    
+    Results are stored on the aggregator instance, so each run starts
+    fresh. List arguments are converted to tuples for hashing; exceptions
+    are not cached.
+    """
+    def _hashable(value: Any) -> Any:
+        return tuple(value) if isinstance(value, list) else value
+    
+    @functools.wraps(method)
+    def wrapper(self: "DataAggregator", *args: Any, **kwargs: Any) -> Any:
+        key = (
+            method.__name__,
+            tuple(_hashable(arg) for arg in args),
+            tuple(sorted((name, _hashable(arg)) for name, arg in kwargs.items()))
+        )
+        cached = self._result_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.RESULT_CACHE_TTL:
+            return cached[1]
+        
+        result = method(self, *args, **kwargs)
+        self._result_cache[key] = (time.monotonic(), result)
+        return result
+    
+    return cast(_Method, wrapper)
+
 
 class DataAggregator:
     """Service for aggregating data from multiple sources."""
     
+    # Upper bound on concurrent git processes
+    GIT_MAX_WORKERS = 8
+    
+    # Seconds a fetched source is reused by repeated calls on one instance
+    RESULT_CACHE_TTL = 60
+    
     def __init__(self, jira_client: Optional[JiraClient] = None, 
                  github_client: Optional[GitHubClient] = None,
                  context_switcher_client: Optional[ContextSwitcherClient] = None):
@@ -28,51 +111,49 @@ class DataAggregator:
         self.jira_client = jira_client
         self.github_client = github_client
         self.context_switcher_client = context_switcher_client
-        self.preprocessor = DataPreprocessor()
+        self._result_cache: Dict[Tuple, Tuple[float, Any]] = {}
     
-    def get_notes_content(self, notes_directory: Path) -> str:
+    @_memoize_per_run
+    def get_notes_content(
+        self,
+        notes_directory: Path,
+        date_range: Optional[Tuple[datetime, datetime]] = None
+    ) -> str:
         """Get combined notes content for today and previous workday.
         
         Args:
             notes_directory: Path to the notes directory
+            date_range: Optional (previous_workday, today) tuple; computed
+                from the current time if not provided
             
         Returns:
             Combined notes content
         """
-        today = datetime.now()
-        if today.weekday() == 0:  # Monday
-            previous_workday = today - timedelta(days=3)  # Friday
-        else:
-            previous_workday = today - timedelta(days=1)  # Yesterday
+        previous_workday, today = date_range or self.get_date_range()
         
-        combined_content = ""
+        parts = []
         
-        # Read today's notes
-        today_path = self._get_note_path(notes_directory, today)
-        if today_path.exists():
-            combined_content += f"Notes for {today.strftime('%Y-%m-%d')}:\n"
-            combined_content += today_path.read_text(encoding="utf-8") + "\n\n"
+        # Read today's notes (just try to open; a missing file is the rare case)
+        today_path = notes_directory / f"{today:%Y/%m/%d}.txt"
+        try:
+            today_notes = today_path.read_text(encoding="utf-8", errors="replace")
+            parts.append(f"Notes for {today:%Y-%m-%d}:\n{today_notes}\n\n")
+        except FileNotFoundError:
+            pass
         
         # Read previous workday notes
-        previous_path = self._get_note_path(notes_directory, previous_workday)
-        if previous_path.exists():
-            combined_content += f"Notes for {previous_workday.strftime('%Y-%m-%d')}:\n"
-            combined_content += previous_path.read_text(encoding="utf-8") + "\n\n"
-        
-        return combined_content
-    
-    def _get_note_path(self, base_dir: Path, date: datetime) -> Path:
-        """Get the path to a note file for a specific date.
+        previous_path = notes_directory / f"{previous_workday:%Y/%m/%d}.txt"
+        try:
+            previous_notes = previous_path.read_text(encoding="utf-8", errors="replace")
+            parts.append(
+                f"Notes for {previous_workday:%Y-%m-%d}:\n{previous_notes}\n\n"
+            )
+        except FileNotFoundError:
+            pass
         
-        Args:
-            base_dir: Base directory for notes
-            date: Date for the note
-            
-        Returns:
-            Path to the note file
-        """
-        return base_dir / date.strftime("%Y") / date.strftime("%m") / f"{date.strftime('%d')}.txt"
+        return "".join(parts)
     
+    @_memoize_per_run
     def get_git_history(self, author: str, directories: List[str], since: str = "yesterday") -> str:
         """Get Git commit history from multiple repositories.
         
@@ -87,8 +168,6 @@ class DataAggregator:
         if not directories:
             return "No Git directories configured."
         
-        history_info = "Include this Git history:\n"
-        
         git_cmd = [
             "git", "log", "--all", "--reverse",
             f"--author={author}",
@@ -97,29 +176,188 @@ class DataAggregator:
             "--date=short"
         ]
         
-        for directory in directories:
-            if not os.path.isdir(directory):
-                continue
+        # Repositories are independent, so run their git processes concurrently
+        repos = [directory for directory in directories if os.path.isdir(directory)]
+        outputs: List[List[str]] = []
+        if repos:
+            max_workers = min(len(repos), self.GIT_MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outputs = list(executor.map(
+                    lambda d: self._read_git_log(git_cmd, d, author, since), repos
+                ))
+        
+        # Assemble in configured order regardless of completion order,
+        # dropping commits already listed (e.g. the same repo cloned twice)
+        parts = ["Include this Git history:"]
+        seen = set()
+        for directory, commits in zip(repos, outputs):
+            unique = []
+            for commit in commits:
+                normalized = commit.lower()
+                if normalized not in seen:
+                    seen.add(normalized)
+                    unique.append(f"- {commit}")
+            if unique:
+                parts.append(f"\nFolder: {directory}")
+                parts.extend(unique)
+        
+        return "\n".join(parts) + "\n"
+    
+    def _read_git_log(
+        self,
+        git_cmd: List[str],
+        directory: str,
+        author: str,
+        since: str
+    ) -> List[str]:
+        """Read git log output for a single repository.
+        
+        Walks the repository in-process with pygit2 when it is installed
+        and the "since" value is understood, avoiding a git process per
+        repository; otherwise runs the git CLI.
+        
+        Args:
+            git_cmd: Equivalent git command for the CLI fallback
+            directory: Repository directory
+            author: Git author pattern to filter by
+            since: Time period to look back
             
+        Returns:
+            Git log lines, or an empty list if git failed
+        """
+        since_timestamp = self._parse_since(since)
+        if pygit2 is not None and since_timestamp is not None:
             try:
-                result = subprocess.run(
-                    git_cmd,
-                    cwd=directory,
-                    text=True,
-                    capture_output=True,
-                    check=True
-                )
-                
-                if result.stdout:
-                    history_info += f"\nFolder: {directory}\n"
-                    for commit in result.stdout.strip().split('\n'):
-                        history_info += f"- {commit}\n"
+                return self._walk_git_log(directory, author, since_timestamp)
+            except (pygit2.GitError, KeyError, ValueError, re.error):
+                pass
+        return self._run_git_log(git_cmd, directory)
+    
+    def _parse_since(self, since: str) -> Optional[float]:
+        """Convert a simple git "since" value to a Unix timestamp.
+        
+        Args:
+            since: 'yesterday' or '<N> minutes/hours/days/weeks ago'
             
-            except subprocess.CalledProcessError:
+        Returns:
+            Timestamp, or None if the value needs git's own date parser
+        """
+        if since.strip() == "yesterday":
+            return time.time() - _SINCE_UNITS["day"]
+        
+        match = _RELATIVE_SINCE_RE.match(since)
+        if match:
+            return time.time() - int(match.group(1)) * _SINCE_UNITS[match.group(2)]
+        return None
+    
+    def _walk_git_log(
+        self,
+        directory: str,
+        author: str,
+        since_timestamp: float
+    ) -> List[str]:
+        """Produce git log output for a repository using pygit2.
+        
+        Mirrors ``git log --all --reverse --author=<author> --since=<since>
+        --pretty=format:"%h %ad | %s [%d] (%an)" --date=short``.
+        
+        Args:
+            directory: Repository directory
+            author: Git author pattern to filter by
+            since_timestamp: Only include commits made after this time
+            
+        Returns:
+            Git log lines, or an empty list if nothing matched
+        """
+        repo = pygit2.Repository(directory)
+        author_re = _author_pattern(author)
+        
+        # Collect ref decorations and the tips to walk from (--all)
+        decorations: Dict[str, List[str]] = {}
+        tips = []
+        head_branch = None if repo.head_is_detached else repo.head.name
+        if repo.head_is_detached:
+            decorations.setdefault(str(repo.head.target), []).append("HEAD")
+            tips.append(repo.head.target)
+        
+        for ref_name in repo.references:
+            try:
+                target = repo.references[ref_name].peel(pygit2.Commit).id
+            except (pygit2.GitError, ValueError):
                 continue
+            tips.append(target)
+            
+            label = repo.references[ref_name].shorthand
+            if ref_name.startswith("refs/tags/"):
+                label = f"tag: {label}"
+            labels = decorations.setdefault(str(target), [])
+            if ref_name == head_branch:
+                labels.insert(0, f"HEAD -> {label}")
+            else:
+                labels.append(label)
+        
+        if not tips:
+            return []
+        
+        # Topological order keeps commits with equal timestamps (rebased or
+        # cherry-picked series) in the same order git log gives them
+        walker = repo.walk(tips[0], SortMode.TIME | SortMode.TOPOLOGICAL)
+        for tip in tips[1:]:
+            walker.push(tip)
+        
+        commits = []
+        for commit in walker:
+            if commit.commit_time < since_timestamp:
+                break
+            signature = commit.author
+            if not author_re.search(f"{signature.name} <{signature.email}>"):
+                continue
+            
+            author_tz = timezone(timedelta(minutes=signature.offset))
+            author_date = datetime.fromtimestamp(signature.time, author_tz)
+            subject = " ".join(commit.message.split("\n\n", 1)[0].split("\n")).strip()
+            refs = decorations.get(str(commit.id))
+            decoration = f" ({', '.join(refs)})" if refs else ""
+            
+            commits.append(
+                f"{commit.short_id} {author_date:%Y-%m-%d} | {subject}"
+                f" [{decoration}] ({signature.name})"
+            )
+        
+        # --reverse: oldest first
+        commits.reverse()
+        return commits
+    
+    def _run_git_log(self, git_cmd: List[str], directory: str) -> List[str]:
+        """Run a git log command in a single repository.
         
-        return history_info
+        Output is consumed line by line as git produces it rather than
+        buffered whole, so large histories don't need a second full copy.
+        
+        Args:
+            git_cmd: Git command to run
+            directory: Repository directory
+            
+        Returns:
+            Non-empty git log lines, or an empty list if git failed
+        """
+        with subprocess.Popen(
+            git_cmd,
+            cwd=directory,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ) as proc:
+            # stdout is only None when it isn't piped, which it always is here
+            output = proc.stdout or ()
+            lines = [line.strip() for line in output if line.strip()]
+        
+        # A failing repository shouldn't affect the others
+        if proc.returncode != 0:
+            return []
+        return lines
     
+    @_memoize_per_run
     def get_timewarrior_summary(self) -> str:
         """Get Timewarrior summary for yesterday.
         
@@ -147,11 +385,22 @@ class DataAggregator:
             return "Jira client not configured."
         
         try:
-            tickets = self.jira_client.get_my_active_tickets()
+            tickets = self._fetch_active_tickets()
             return self.jira_client.format_tickets_for_summary(tickets)
         except Exception as e:
             return f"Error fetching Jira tickets: {e}"
     
+    @_memoize_per_run
+    def _fetch_active_tickets(self) -> List[Dict]:
+        """Fetch active Jira tickets, reusing a recent result.
+        
+        Returns:
+            List of active ticket dictionaries
+        """
+        if not self.jira_client:
+            return []
+        return self.jira_client.get_my_active_tickets()
+    
     def get_github_events(self, username: str, org: Optional[str] = None) -> str:
         """Get formatted GitHub events.
         
@@ -166,12 +415,31 @@ class DataAggregator:
             return "GitHub client not configured."
         
         try:
-            events = self.github_client.get_user_events(username, org)
+            events = self._fetch_user_events(username, org)
             recent_events = self.github_client.filter_recent_events(events)
             return self.github_client.format_events_for_summary(recent_events)
         except Exception as e:
             return f"Error fetching GitHub events: {e}"
     
+    @_memoize_per_run
+    def _fetch_user_events(
+        self,
+        username: str,
+        org: Optional[str] = None
+    ) -> List[Dict]:
+        """Fetch GitHub events for a user, reusing a recent result.
+        
+        Args:
+            username: GitHub username
+            org: Optional organization name
+            
+        Returns:
+            List of event dictionaries
+        """
+        if not self.github_client:
+            return []
+        return self.github_client.get_user_events(username, org)
+    
     def get_context_switcher_data(self, days_back: int = 2) -> str:
         """Get context switcher productivity metrics.
         
@@ -194,13 +462,20 @@ class DataAggregator:
         except Exception as e:
             return f"Error fetching context switcher data: {e}"
     
-    def get_date_range(self) -> Tuple[datetime, datetime]:
+    def get_date_range(
+        self,
+        today: Optional[datetime] = None
+    ) -> Tuple[datetime, datetime]:
         """Get the date range for data collection (previous workday to today).
         
+        Args:
+            today: Reference time; defaults to now
+        
         Returns:
             Tuple of (start_date, end_date)
         """
-        today = datetime.now()
+        if today is None:
+            today = datetime.now()
         if today.weekday() == 0:  # Monday
             previous_workday = today - timedelta(days=3)  # Friday
         else:
@@ -214,7 +489,8 @@ class DataAggregator:
         git_directories: List[str],
         github_username: Optional[str] = None,
         github_org: Optional[str] = None,
-        context_switcher_days_back: int = 2
+        context_switcher_days_back: int = 2,
+        date_range: Optional[Tuple[datetime, datetime]] = None
     ) -> str:
         """Aggregate all available data sources.
         
@@ -224,35 +500,50 @@ class DataAggregator:
             git_directories: List of Git directories
             github_username: Optional GitHub username
             github_org: Optional GitHub organization
+            date_range: Optional (previous_workday, today) tuple shared with
+                the caller; computed once here if not provided
             
         Returns:
             Combined data string
         """
-        combined_data = ""
-        
-        # Add notes
-        notes = self.get_notes_content(notes_directory)
-        if notes:
-            combined_data += notes
+        sections = []
+        date_range = date_range or self.get_date_range()
         
-        # Add Jira tickets
-        jira_info = self.get_jira_tickets()
-        combined_data += jira_info + "\n"
-        
-        # Add Git history
-        git_history = self.get_git_history(git_author, git_directories)
-        combined_data += git_history + "\n"
-        
-        # Add Timewarrior summary
-        timew_summary = self.get_timewarrior_summary()
-        combined_data += timew_summary + "\n"
-        
-        # Add GitHub events if configured
-        if github_username and self.github_client:
-            github_events = self.get_github_events(github_username, github_org)
-            combined_data += github_events + "\n"
+        # Every source is blocking I/O, so fetch them all concurrently
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            notes_future = executor.submit(
+                self.get_notes_content, notes_directory, date_range
+            )
+            jira_future = executor.submit(self.get_jira_tickets)
+            git_future = executor.submit(
+                self.get_git_history, git_author, git_directories
+            )
+            timew_future = executor.submit(self.get_timewarrior_summary)
+            github_future = None
+            if github_username and self.github_client:
+                github_future = executor.submit(
+                    self.get_github_events, github_username, github_org
+                )
+            
+            # Add notes
+            notes = notes_future.result()
+            if notes:
+                sections.append(notes)
+            
+            # Add Jira tickets
+            sections.append(jira_future.result() + "\n")
+            
+            # Add Git history
+            sections.append(git_future.result() + "\n")
+            
+            # Add Timewarrior summary
+            sections.append(timew_future.result() + "\n")
+            
+            # Add GitHub events if configured
+            if github_future is not None:
+                sections.append(github_future.result() + "\n")
         
-        return combined_data
+        return "".join(sections)
     
     def aggregate_all_data_structured(
         self,
@@ -260,7 +551,8 @@ class DataAggregator:
         git_author: str,
         git_directories: List[str],
         github_username: Optional[str] = None,
-        github_org: Optional[str] = None
+        github_org: Optional[str] = None,
+        date_range: Optional[Tuple[datetime, datetime]] = None
     ) -> str:
         """Aggregate and structure all data sources for better AI comprehension.
         
@@ -270,53 +562,66 @@ class DataAggregator:
             git_directories: List of Git directories
             github_username: Optional GitHub username
             github_org: Optional GitHub organization
+            date_range: Optional (previous_workday, today) tuple shared with
+                the caller; computed once here if not provided
             
         Returns:
             Structured and preprocessed data string
         """
-        # Get raw data from all sources
-        notes = self.get_notes_content(notes_directory)
-        git_history = self.get_git_history(git_author, git_directories)
-        timew_summary = self.get_timewarrior_summary()
-        
-        # Get Jira tickets as structured data
-        jira_tickets = []
-        if self.jira_client:
-            try:
-                jira_tickets = self.jira_client.get_my_active_tickets()
-            except Exception:
-                pass
+        date_range = date_range or self.get_date_range()
+        
+        # Every source is blocking I/O, so fetch them all concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            notes_future = executor.submit(
+                self.get_notes_content, notes_directory, date_range
+            )
+            git_future = executor.submit(
+                self.get_git_history, git_author, git_directories
+            )
+            timew_future = executor.submit(self.get_timewarrior_summary)
+            jira_future = None
+            if self.jira_client:
+                jira_future = executor.submit(self._fetch_active_tickets)
+            
+            # Get raw data from all sources
+            notes = notes_future.result()
+            git_history = git_future.result()
+            timew_summary = timew_future.result()
+            
+            # Get Jira tickets as structured data
+            jira_tickets = []
+            if jira_future is not None:
+                try:
+                    jira_tickets = jira_future.result()
+                except Exception:
+                    pass
         
         # Correlate ticket data across sources
-        correlated_data = self.preprocessor.correlate_ticket_data(
+        correlated_data = DataPreprocessor.correlate_ticket_data(
             notes,
             jira_tickets,
             git_history,
             timew_summary
         )
         
-        # Get date range
-        date_range = self.get_date_range()
-        
         # Structure the data for AI
-        structured_data = self.preprocessor.structure_for_ai(
+        structured_data = DataPreprocessor.structure_for_ai(
             correlated_data,
             notes,
             date_range
         )
         
         # Add raw data sections that weren't correlated
-        structured_data += "\n\n=== ADDITIONAL DATA ===\n"
+        sections = [structured_data, "\n\n=== ADDITIONAL DATA ===\n"]
         
-        # Add Git history summary
+        # Add Git history summary (already deduplicated by get_git_history)
         if git_history and "No Git directories configured" not in git_history:
-            structured_data += "\nGIT ACTIVITY:\n"
-            # Deduplicate git history
-            structured_data += self.preprocessor.deduplicate_content(git_history)
+            sections.append("\nGIT ACTIVITY:\n")
+            sections.append(git_history)
         
         # Add Timewarrior summary
         if timew_summary and "No timewarrior summary" not in timew_summary:
-            structured_data += "\n\nTIME TRACKING:\n"
-            structured_data += timew_summary
+            sections.append("\n\nTIME TRACKING:\n")
+            sections.append(timew_summary)
         
-        return structured_data
\ No newline at end of file
+        return "".join(sections)
\ No newline at end of file
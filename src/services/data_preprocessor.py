@@ -9,24 +9,28 @@ from collections import defaultdict
 class DataPreprocessor:
     """Service for preprocessing and structuring data for better AI comprehension."""
     
-    # Common Jira ticket patterns
-    TICKET_PATTERNS = [
-        r'\b([A-Z]{2,}-\d+)\b',  # Standard JIRA format (INFRA-1234)
-        r'\b([A-Z]+\d+)\b',       # Compact format (INFRA1234)
-    ]
+    # Common Jira ticket formats in one pass: standard (INFRA-1234) or
+    # compact (INFRA1234). Commit subjects almost always use uppercase IDs,
+    # so per-line git matching tries the case-sensitive variant first.
+    TICKET_PATTERN = re.compile(r'\b(?:[A-Z]{2,}-\d+|[A-Z]+\d+)\b')
+    TICKET_PATTERN_ANY_CASE = re.compile(TICKET_PATTERN.pattern, re.IGNORECASE)
     
     # Time tracking patterns
     TIME_PATTERNS = [
-        r'(\d{1,2}:\d{2})\s*(?:am|pm|AM|PM)?',  # Time mentions
-        r'(\d+)\s*(?:hours?|hrs?|minutes?|mins?)',  # Duration mentions
+        # Time mentions
+        re.compile(r'(\d{1,2}:\d{2})\s*(?:am|pm|AM|PM)?', re.IGNORECASE),
+        # Duration mentions
+        re.compile(r'(\d+)\s*(?:hours?|hrs?|minutes?|mins?)', re.IGNORECASE),
     ]
     
-    def __init__(self):
-        """Initialize the preprocessor."""
-        self.ticket_map = {}
-        self.time_entries = defaultdict(list)
+    # Cleanup and duration patterns
+    TIMESTAMP_PREFIX_PATTERN = re.compile(r'(\d{1,2}:\d{2})\s*(?:am|pm|AM|PM)?\s*-\s*')
+    BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+    MULTI_SPACE_PATTERN = re.compile(r' {2,}')
+    DURATION_PATTERN = re.compile(r'(\d+:\d+:\d+|\d+:\d+)')
     
-    def extract_ticket_ids(self, text: str) -> Set[str]:
+    @classmethod
+    def extract_ticket_ids(cls, text: str) -> Set[str]:
         """Extract all ticket IDs from text.
         
         Args:
@@ -35,13 +39,27 @@ class DataPreprocessor:
         Returns:
             Set of unique ticket IDs found
         """
-        tickets = set()
-        for pattern in self.TICKET_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            tickets.update(match.upper() for match in matches)
-        return tickets
+        return {match.upper() for match in cls.TICKET_PATTERN_ANY_CASE.findall(text)}
+    
+    @classmethod
+    def _extract_commit_ticket_ids(cls, commit: str) -> Set[str]:
+        """Extract ticket IDs from a single git log line.
+        
+        Args:
+            commit: One line of git log output
+            
+        Returns:
+            Set of unique ticket IDs found
+        """
+        tickets = set(cls.TICKET_PATTERN.findall(commit))
+        if tickets:
+            return tickets
+        # Only pay for case-insensitive matching and uppercasing when the
+        # line has no uppercase IDs at all
+        return cls.extract_ticket_ids(commit)
     
-    def normalize_ticket_references(self, text: str) -> str:
+    @classmethod
+    def normalize_ticket_references(cls, text: str) -> str:
         """Normalize all ticket references to consistent format.
         
         Args:
@@ -51,11 +69,10 @@ class DataPreprocessor:
             Text with normalized ticket references
         """
         # Ensure all ticket IDs are uppercase and properly formatted
-        for pattern in self.TICKET_PATTERNS:
-            text = re.sub(pattern, lambda m: m.group(1).upper(), text)
-        return text
+        return cls.TICKET_PATTERN_ANY_CASE.sub(lambda m: m.group(0).upper(), text)
     
-    def extract_timestamps(self, text: str) -> List[str]:
+    @classmethod
+    def extract_timestamps(cls, text: str) -> List[str]:
         """Extract time references from text.
         
         Args:
@@ -65,13 +82,14 @@ class DataPreprocessor:
             List of time references found
         """
         timestamps = []
-        for pattern in self.TIME_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in cls.TIME_PATTERNS:
+            matches = pattern.findall(text)
             timestamps.extend(matches)
         return timestamps
     
+    @classmethod
     def correlate_ticket_data(
-        self, 
+        cls,
         notes: str, 
         jira_tickets: List[Dict],
         git_commits: str,
@@ -88,118 +106,124 @@ class DataPreprocessor:
         Returns:
             Dictionary mapping ticket IDs to correlated data
         """
-        correlated = defaultdict(lambda: {
-            'mentioned_in_notes': False,
-            'jira_status': None,
-            'jira_summary': None,
-            'git_commits': [],
-            'time_tracked': False,
-            'contexts': []
-        })
+        # Extract tickets from notes, Jira and timewarrior
+        notes_tickets = cls.extract_ticket_ids(notes)
+        timew_tickets = cls.extract_ticket_ids(timew_data)
+        jira_by_id = {ticket.get('key', ''): ticket for ticket in jira_tickets}
+        jira_by_id.pop('', None)
+        
+        # Index git log lines by the tickets they mention in a single pass
+        git_index = defaultdict(list)
+        for line in git_commits.splitlines():
+            commit = line.strip()
+            if commit:
+                for ticket in cls._extract_commit_ticket_ids(commit):
+                    git_index[ticket].append(commit)
         
-        # Extract tickets from notes
-        notes_tickets = self.extract_ticket_ids(notes)
+        # Build every entry up front from the union of all sources
+        all_ids = notes_tickets | jira_by_id.keys() | git_index.keys() | timew_tickets
+        correlated = {
+            ticket: {
+                'mentioned_in_notes': False,
+                'jira_status': None,
+                'jira_summary': None,
+                'git_commits': [],
+                'time_tracked': False,
+                'contexts': []
+            }
+            for ticket in all_ids
+        }
+        
+        # Mark tickets from notes, locating each first mention in one scan
+        first_spans: Dict[str, Tuple[int, int]] = {}
+        for match in cls.TICKET_PATTERN_ANY_CASE.finditer(notes):
+            first_spans.setdefault(match.group(0).upper(), match.span())
         for ticket in notes_tickets:
             correlated[ticket]['mentioned_in_notes'] = True
             # Extract context around ticket mention
-            context = self._extract_context(notes, ticket)
-            if context:
-                correlated[ticket]['contexts'].append(('notes', context))
+            span = first_spans.get(ticket)
+            if span:
+                context = cls._extract_context(notes, *span)
+                if context:
+                    correlated[ticket]['contexts'].append(('notes', context))
         
         # Add Jira ticket data
-        for ticket in jira_tickets:
-            ticket_id = ticket.get('key', '')
-            if ticket_id:
-                fields = ticket.get('fields', {})
-                correlated[ticket_id]['jira_status'] = fields.get('status', {}).get('name')
-                correlated[ticket_id]['jira_summary'] = fields.get('summary')
+        for ticket_id, ticket in jira_by_id.items():
+            fields = ticket.get('fields', {})
+            correlated[ticket_id]['jira_status'] = fields.get('status', {}).get('name')
+            correlated[ticket_id]['jira_summary'] = fields.get('summary')
         
-        # Extract tickets from git commits
-        git_tickets = self.extract_ticket_ids(git_commits)
-        for ticket in git_tickets:
-            # Find associated commit messages
-            commits = self._extract_git_commits_for_ticket(git_commits, ticket)
-            correlated[ticket]['git_commits'].extend(commits)
+        # Attach git commits, dropping repeated lines
+        for ticket, commits in git_index.items():
+            correlated[ticket]['git_commits'].extend(dict.fromkeys(commits))
         
-        # Extract tickets from timewarrior
-        timew_tickets = self.extract_ticket_ids(timew_data)
+        # Mark tickets from timewarrior, splitting its lines only once
+        timew_lines = timew_data.splitlines()
         for ticket in timew_tickets:
             correlated[ticket]['time_tracked'] = True
             # Extract time duration if available
-            duration = self._extract_time_duration(timew_data, ticket)
+            duration = cls._extract_time_duration(timew_lines, ticket)
             if duration:
                 correlated[ticket]['time_duration'] = duration
         
-        return dict(correlated)
+        return correlated
     
-    def _extract_context(self, text: str, ticket_id: str, context_size: int = 100) -> str:
+    @staticmethod
+    def _extract_context(
+        text: str,
+        start: int,
+        end: int,
+        context_size: int = 100
+    ) -> str:
         """Extract context around a ticket mention.
         
         Args:
-            text: Full text to search
-            ticket_id: Ticket ID to find context for
+            text: Full text containing the mention
+            start: Start offset of the mention
+            end: End offset of the mention
             context_size: Characters of context on each side
             
         Returns:
-            Context string or empty if not found
+            Context string
         """
-        pattern = re.compile(rf'\b{re.escape(ticket_id)}\b', re.IGNORECASE)
-        match = pattern.search(text)
-        if match:
-            start = max(0, match.start() - context_size)
-            end = min(len(text), match.end() + context_size)
-            # Find sentence boundaries
-            context = text[start:end].strip()
-            # Clean up partial sentences
-            if start > 0:
-                context = '...' + context
-            if end < len(text):
-                context = context + '...'
-            return context
-        return ""
+        start = max(0, start - context_size)
+        end = min(len(text), end + context_size)
+        # Find sentence boundaries
+        context = text[start:end].strip()
+        # Clean up partial sentences
+        if start > 0:
+            context = '...' + context
+        if end < len(text):
+            context = context + '...'
+        return context
     
-    def _extract_git_commits_for_ticket(self, git_log: str, ticket_id: str) -> List[str]:
-        """Extract git commits mentioning a ticket.
-        
-        Args:
-            git_log: Git log output
-            ticket_id: Ticket ID to search for
-            
-        Returns:
-            List of commit messages mentioning the ticket
-        """
-        commits = []
-        lines = git_log.split('\n')
-        for line in lines:
-            if ticket_id.upper() in line.upper():
-                # Clean up the commit message
-                commit = line.strip()
-                if commit and commit not in commits:
-                    commits.append(commit)
-        return commits
-    
-    def _extract_time_duration(self, timew_data: str, ticket_id: str) -> Optional[str]:
+    @classmethod
+    def _extract_time_duration(
+        cls,
+        timew_lines: List[str],
+        ticket_id: str
+    ) -> Optional[str]:
         """Extract time duration for a ticket from timewarrior data.
         
         Args:
-            timew_data: Timewarrior output
+            timew_lines: Timewarrior output, already split into lines
             ticket_id: Ticket ID to find duration for
             
         Returns:
             Duration string or None
         """
-        lines = timew_data.split('\n')
-        for i, line in enumerate(lines):
+        for i, line in enumerate(timew_lines):
             if ticket_id in line:
                 # Look for duration patterns in the same or nearby lines
-                for j in range(max(0, i-1), min(len(lines), i+2)):
-                    duration_match = re.search(r'(\d+:\d+:\d+|\d+:\d+)', lines[j])
+                for j in range(max(0, i-1), min(len(timew_lines), i+2)):
+                    duration_match = cls.DURATION_PATTERN.search(timew_lines[j])
                     if duration_match:
                         return duration_match.group(1)
         return None
     
+    @classmethod
     def structure_for_ai(
-        self,
+        cls,
         correlated_data: Dict[str, Dict],
         notes: str,
         date_range: Tuple[datetime, datetime]
@@ -274,12 +298,13 @@ class DataPreprocessor:
         # Add cleaned notes
         structured.append("=== WORK NOTES ===")
         # Remove redundant ticket IDs from notes since we've already structured them
-        cleaned_notes = self._clean_notes(notes, correlated_data.keys())
+        cleaned_notes = cls._clean_notes(notes, correlated_data.keys())
         structured.append(cleaned_notes)
         
         return '\n'.join(structured)
     
-    def _clean_notes(self, notes: str, ticket_ids: Set[str]) -> str:
+    @classmethod
+    def _clean_notes(cls, notes: str, ticket_ids: Set[str]) -> str:
         """Clean notes for better readability.
         
         Args:
@@ -290,11 +315,11 @@ class DataPreprocessor:
             Cleaned notes text
         """
         # Remove duplicate timestamps
-        notes = re.sub(r'(\d{1,2}:\d{2})\s*(?:am|pm|AM|PM)?\s*-\s*', '', notes)
+        notes = cls.TIMESTAMP_PREFIX_PATTERN.sub('', notes)
         
         # Remove excessive whitespace
-        notes = re.sub(r'\n{3,}', '\n\n', notes)
-        notes = re.sub(r' {2,}', ' ', notes)
+        notes = cls.BLANK_LINES_PATTERN.sub('\n\n', notes)
+        notes = cls.MULTI_SPACE_PATTERN.sub(' ', notes)
         
         # Organize by paragraphs
         lines = notes.split('\n')
@@ -304,26 +329,4 @@ class DataPreprocessor:
             if line:
                 cleaned_lines.append(line)
         
-        return '\n'.join(cleaned_lines)
-    
-    def deduplicate_content(self, text: str) -> str:
-        """Remove duplicate lines and similar content.
-        
-        Args:
-            text: Text to deduplicate
-            
-        Returns:
-            Deduplicated text
-        """
-        lines = text.split('\n')
-        seen = set()
-        unique_lines = []
-        
-        for line in lines:
-            # Normalize for comparison
-            normalized = line.strip().lower()
-            if normalized and normalized not in seen:
-                seen.add(normalized)
-                unique_lines.append(line)
-        
-        return '\n'.join(unique_lines)
\ No newline at end of file
+        return '\n'.join(cleaned_lines)
\ No newline at end of file
@@ -1,15 +1,20 @@
 """Main standup automation application."""
 
 import os
-from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
 from .config import Config
 from .clients.jira_client import JiraClient
 from .clients.github_client import GitHubClient
 from .services.data_aggregator import DataAggregator
 from .services.ai_service import AIService
+from .utils.cache import DiskCache
 from .utils.logger import setup_logger, get_logger
 
 
@@ -24,16 +29,21 @@ class StandupAutomation:
         """
         self.config = Config(config_path)
         self.logger = setup_logger()
+        self.cache = DiskCache(self.config.cache_directory)
         
         # Initialize services
         self.jira_client = self._setup_jira_client()
         # GitHub client disabled - API doesn't support user event streams effectively
         self.github_client = None
         self.data_aggregator = DataAggregator(self.jira_client, self.github_client)
+        # Computed once so notes, the prompt and the saved summary agree
+        # even if the run straddles midnight
+        self.date_range = self.data_aggregator.get_date_range()
         self.ai_service = AIService(
             self.config.project_id,
             self.config.location,
-            self.config.vertex_model
+            self.config.vertex_model,
+            compress_prompt=self.config.vertex_compress_prompt
         )
     
     def _setup_jira_client(self) -> Optional[JiraClient]:
@@ -46,7 +56,8 @@ class StandupAutomation:
             return JiraClient(
                 self.config.jira_domain,
                 self.config.email,
-                self.config.jira_api_key
+                self.config.jira_api_key,
+                cache=self.cache
             )
         except Exception as e:
             self.logger.warning(f"Failed to setup Jira client: {e}")
@@ -69,7 +80,8 @@ class StandupAutomation:
             return GitHubClient(
                 self.config.github_app_id,
                 self.config.github_installation_id,
-                self.config.private_key_path
+                self.config.private_key_path,
+                cache=self.cache
             )
         except Exception as e:
             self.logger.warning(f"Failed to setup GitHub client: {e}")
@@ -94,14 +106,16 @@ class StandupAutomation:
                     self.config.notes_directory,
                     self.config.git_author,
                     self.config.git_directories,
-                    self.config.github_username
+                    self.config.github_username,
+                    date_range=self.date_range
                 )
             else:
                 combined_data = self.data_aggregator.aggregate_all_data(
                     self.config.notes_directory,
                     self.config.git_author,
                     self.config.git_directories,
-                    self.config.github_username
+                    self.config.github_username,
+                    date_range=self.date_range
                 )
             
             if not combined_data.strip():
@@ -144,17 +158,16 @@ class StandupAutomation:
             output_path = self.config.output_directory / "summaries.txt"
             
             # Create date range string
-            today = datetime.now()
-            if today.weekday() == 0:  # Monday
-                previous_workday = today - timedelta(days=3)
-            else:
-                previous_workday = today - timedelta(days=1)
-            
+            previous_workday, today = self.date_range
             date_range = f"{previous_workday.strftime('%Y-%m-%d')} to {today.strftime('%Y-%m-%d')}"
             
-            # Append summary to file
-            with open(output_path, "a", encoding="utf-8") as f:
-                f.write(f"{date_range}: {summary}\n")
+            # Append summary as one pre-encoded write; lock so overlapping
+            # runs can't interleave their entries
+            payload = f"{date_range}: {summary}\n".encode("utf-8")
+            with open(output_path, "ab") as f:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                f.write(payload)
             
             self.logger.info(f"Summary saved to {output_path}")
             return True
@@ -0,0 +1,88 @@
+"""Small on-disk cache with per-entry expiry, shared across runs."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+class DiskCache:
+    """JSON-file cache keyed by string with optional per-entry TTL.
+    
+    Caching is best-effort: unreadable, corrupt or expired entries are
+    treated as misses and write failures are ignored.
+    """
+    
+    def __init__(self, directory: Path):
+        """Initialize the cache.
+        
+        Args:
+            directory: Directory where cache entries are stored
+        """
+        self.directory = Path(directory).expanduser()
+    
+    def _path(self, key: str) -> Path:
+        """Get the file path for a cache key.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Path to the entry file
+        """
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached value.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss or expired entry
+        
+        Returns:
+            Cached value or default
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return default
+        
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and time.time() >= expires_at:
+            return default
+        
+        return entry.get("value", default)
+    
+    def set(self, key: str, value: Any, expire: Optional[float] = None) -> None:
+        """Store a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value to store
+            expire: Seconds until the entry expires, or None to keep it
+        """
+        entry = {
+            "value": value,
+            "expires_at": time.time() + expire if expire is not None else None
+        }
+        
+        path = self._path(key)
+        tmp_name = f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_path = path.with_name(tmp_name)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Entries may hold tokens, so keep them private to the user
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,26 @@
+"""JSON decoding helpers with an optional fast path."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document, using orjson when it is installed.
+    
+    Args:
+        data: Raw JSON bytes or text (e.g. ``response.content``)
+    
+    Returns:
+        Decoded Python object
+    
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
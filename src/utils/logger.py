@@ -1,9 +1,26 @@
 """Logging configuration for the application."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Set
+
+# Shared formatter; the format string is constant
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+# The format doesn't use thread, process or caller info, so skip
+# collecting it (and the stack walk for caller info) on every record
+logging.logThreads = False
+logging.logProcesses = False
+logging._srcfile = None
+
+# Log directories already ensured by this process
+_created_dirs: Set[Path] = set()
 
 
 def setup_logger(
@@ -30,26 +47,52 @@ def setup_logger(
     if logger.handlers:
         return logger
     
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    formatter = _FORMATTER
+    
+    handlers: List[logging.Handler] = []
     
     # Console handler
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # File handler
     if log_file:
         # Ensure log directory exists
-        log_file.parent.mkdir(parents=True, exist_ok=True)
+        if log_file.parent not in _created_dirs:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(log_file.parent)
         
-        file_handler = logging.FileHandler(log_file)
+        # Don't open the file until something is actually logged
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Batch file writes; flush immediately on errors so crash
+        # diagnostics still reach the disk
+        memory_handler = MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        memory_handler.setLevel(level)
+        # Registered first so it runs after the listener has drained
+        atexit.register(memory_handler.flush)
+        handlers.append(memory_handler)
+    
+    # Log calls only enqueue records; a background listener does the
+    # blocking console and disk writes
+    if handlers:
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        # Drain and flush pending records on exit (this also keeps the
+        # listener referenced for the life of the process)
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
     
     return logger
 
@@ -1,38 +1,87 @@
+import atexit
 import os
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 import json
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+import hashlib
+import sqlite3
+import time
 import vertexai
 from vertexai.generative_models import GenerativeModel
+try:
+    from vertexai.preview import caching
+except ImportError:  # SDK without context caching
+    caching = None
 import configparser
 import subprocess
-from typing import List
-
-# Load configuration from config.ini
-config = configparser.ConfigParser()
-config.read("config.ini")
-
-# Variables from the config file
-PROJECT_ID = config.get("settings", "PROJECT_ID")
-LOCATION = config.get("settings", "LOCATION")
-JIRA_DOMAIN = config.get("settings", "JIRA_DOMAIN")
-EMAIL = config.get("settings", "EMAIL")
-JIRA_API_KEY = config.get("settings", "JIRA_API_KEY")
-NOTES_DIRECTORY = config.get("paths", "NOTES_DIRECTORY")
-OUTPUT_DIRECTORY = config.get("paths", "OUTPUT_DIRECTORY")
-GIT_AUTHOR = config.get("settings", "GIT_AUTHOR")
-GIT_DIRECTORIES = json.loads(config.get("paths", "GIT_DIRECTORIES"))
-INSTRUCTION = config.get("vertex", "INSTRUCTION")
-MODEL = config.get("vertex", "MODEL")
-
-# Initialize Vertex AI
-vertexai.init(project=PROJECT_ID, location=LOCATION)
-model = GenerativeModel(MODEL)
-
-# Jira API endpoint and authentication
-url = f"https://{JIRA_DOMAIN}/rest/api/3/search"
-auth = HTTPBasicAuth(EMAIL, JIRA_API_KEY)
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+CONFIG_PATH = "config.ini"
+
+# Variables from the config file, set by load_config() when the script runs
+# so importing this module has no side effects
+PROJECT_ID = ""
+LOCATION = ""
+JIRA_DOMAIN = ""
+EMAIL = ""
+JIRA_API_KEY = ""
+NOTES_DIRECTORY = ""
+OUTPUT_DIRECTORY = ""
+GIT_AUTHOR = ""
+GIT_DIRECTORIES: List[str] = []
+INSTRUCTION = ""
+MODEL = ""
+
+# Vertex AI model and Jira search endpoint, also set by load_config();
+# None and "" until then
+model: Optional[GenerativeModel] = None
+url = ""
+
+# Local caches live here; load_config() honours [paths] CACHE_DIRECTORY
+CACHE_DIRECTORY = os.path.expanduser("~/.cache/standup-helper")
+
+# Vertex context cache holding INSTRUCTION, so it isn't re-sent every run.
+# The cache's resource name is remembered in CACHE_DIRECTORY.
+INSTRUCTION_CACHE_FILE = ".vertex_instruction_cache.json"
+INSTRUCTION_CACHE_TTL = timedelta(hours=24)
+
+# Exact-match cache of generated summaries, so same-day re-runs with
+# unchanged inputs skip Vertex AI entirely. It holds note contents, so it
+# is kept private and old entries are dropped.
+SUMMARY_CACHE_DB = "summaries_cache.db"
+SUMMARY_CACHE_MAX_AGE = timedelta(days=7)
+
+# Output files opened for appending, kept open for the life of the process
+_out_fds: Dict[str, int] = {}
+
+# Jira search page size; further pages are fetched concurrently
+JIRA_PAGE_SIZE = 500
+JIRA_MAX_WORKERS = 8
+
+# Sort order for Jira's default priorities, by name or by their stock ids
+# ("1" is Highest ... "5" is Lowest); other priorities sort last and keep
+# the order Jira returned them in
+PRIORITY_RANK = {"Highest": 0, "High": 1, "Medium": 2, "Low": 3, "Lowest": 4}
+PRIORITY_ID_RANK = {str(rank + 1): rank for rank in PRIORITY_RANK.values()}
+
+# Upper bound on concurrent git processes, to avoid fork storms with many repos
+GIT_MAX_WORKERS = 8
+
+# Fixed git log arguments; the author and since filters are appended per call
+_GIT_LOG_STATIC = (
+    "log", "--all", "--reverse", "-z",
+    "--pretty=format:%h %ad | %s [%d] (%an)",
+    "--date=short"
+)
 
 # Headers for Jira
 headers = {
@@ -40,83 +89,174 @@ headers = {
     "Content-Type": "application/json"
 }
 
+# Shared keep-alive session so paginated Jira requests reuse pooled
+# connections; load_config() adds the credentials
+session = requests.Session()
+session.headers.update(headers)
+session.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+def load_config(path: str = CONFIG_PATH) -> None:
+    """Load settings from config.ini, then initialize Vertex AI and the Jira session."""
+    global PROJECT_ID, LOCATION, JIRA_DOMAIN, EMAIL, JIRA_API_KEY, NOTES_DIRECTORY
+    global OUTPUT_DIRECTORY, GIT_AUTHOR, GIT_DIRECTORIES, INSTRUCTION, MODEL, model, url
+    global CACHE_DIRECTORY
+
+    config = configparser.ConfigParser()
+    config.read(path)
+
+    PROJECT_ID = config.get("settings", "PROJECT_ID")
+    LOCATION = config.get("settings", "LOCATION")
+    JIRA_DOMAIN = config.get("settings", "JIRA_DOMAIN")
+    EMAIL = config.get("settings", "EMAIL")
+    JIRA_API_KEY = config.get("settings", "JIRA_API_KEY")
+    NOTES_DIRECTORY = config.get("paths", "NOTES_DIRECTORY")
+    OUTPUT_DIRECTORY = config.get("paths", "OUTPUT_DIRECTORY")
+    GIT_AUTHOR = config.get("settings", "GIT_AUTHOR")
+    GIT_DIRECTORIES = json.loads(config.get("paths", "GIT_DIRECTORIES"))
+    CACHE_DIRECTORY = os.path.expanduser(
+        config.get("paths", "CACHE_DIRECTORY", fallback=CACHE_DIRECTORY)
+    )
+    INSTRUCTION = config.get("vertex", "INSTRUCTION")
+    MODEL = config.get("vertex", "MODEL")
+
+    # Initialize Vertex AI
+    vertexai.init(project=PROJECT_ID, location=LOCATION)
+    model = GenerativeModel(MODEL)
+
+    # Jira API endpoint and authentication
+    url = f"https://{JIRA_DOMAIN}/rest/api/3/search"
+    session.auth = HTTPBasicAuth(EMAIL, JIRA_API_KEY)
+
+def _search_page(jql_query: str, start_at: int) -> requests.Response:
+    """POST a single page of a Jira JQL search."""
+    body = {
+        "jql": jql_query,
+        # "key" is always returned, so only request the fields we read
+        "fields": ["summary", "status", "priority"],
+        "startAt": start_at,
+        "maxResults": JIRA_PAGE_SIZE
+    }
+    # orjson produces bytes directly; Content-Type is set on the session
+    payload = orjson.dumps(body) if orjson is not None else json.dumps(body)
+    return session.post(url, data=payload)
+
+def _response_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 def fetch_tickets():
     """Fetch tickets from Jira using a POST request and JQL."""
-    jql_query = 'assignee = currentUser() AND status in ("To Do", "In Progress", "On Hold") ORDER BY priority DESC'
-    payload = json.dumps({
-        "jql": jql_query,
-        "fields": ["summary", "status", "key"],
-        "maxResults": 50
-    })
+    # Ordered client-side below, sparing Jira a server-side sort
+    jql_query = 'assignee = currentUser() AND status in ("To Do", "In Progress", "On Hold")'
+
+    if not url:
+        print("Jira is not configured; call load_config() first")
+        return []
 
-    response = requests.post(url, data=payload, headers=headers, auth=auth)
+    response = _search_page(jql_query, 0)
 
-    if response.status_code == 200:
-        return response.json().get("issues", [])
-    else:
+    if response.status_code != 200:
         print(f"Failed to fetch tickets: {response.status_code} - {response.text}")
         return []
 
+    data = _response_json(response)
+    issues = data.get("issues", [])
+    total = data.get("total", len(issues))
+
+    # Jira may cap maxResults below what was asked, so step by the size of
+    # the page it actually returned
+    offsets = range(len(issues), total, len(issues)) if issues else range(0)
+    if offsets:
+        with ThreadPoolExecutor(max_workers=min(len(offsets), JIRA_MAX_WORKERS)) as executor:
+            pages = executor.map(lambda start_at: _search_page(jql_query, start_at), offsets)
+            for page in pages:
+                if page.status_code == 200:
+                    issues.extend(_response_json(page).get("issues", []))
+                else:
+                    print(f"Failed to fetch tickets page: {page.status_code} - {page.text}")
+
+    issues.sort(key=_priority_rank)
+    return issues
+
+def _priority_rank(ticket: dict) -> int:
+    """Sort key placing higher-priority tickets first."""
+    priority = ticket.get("fields", {}).get("priority") or {}
+    rank = PRIORITY_RANK.get(priority.get("name", ""))
+    if rank is None:
+        # A renamed default priority still has its stock id
+        rank = PRIORITY_ID_RANK.get(priority.get("id", ""))
+    return len(PRIORITY_RANK) if rank is None else rank
+
 def format_tickets_for_prompt(tickets):
     """Format Jira tickets data for appending to Vertex AI prompt."""
     if not tickets:
         return "No tickets found."
     
-    ticket_info = "Take into account these tickets:\n"
+    ticket_info = ["Take into account these tickets:"]
     for ticket in tickets:
         key = ticket.get("key")
         fields = ticket.get("fields", {})
         summary = fields.get("summary", "No summary available")
         status = fields.get("status", {}).get("name", "No status available")
         
-        ticket_info += f"- {key} ({status}): {summary}\n"
-    return ticket_info
+        ticket_info.append(f"- {key} ({status}): {summary}")
+    return "\n".join(ticket_info) + "\n"
 
 def get_git_history(author: str, folders: List[str], since: str = "yesterday") -> dict:
     """
     Retrieves the Git commit history for the specified author from multiple folders.
     """
-    commit_data = {}
-
-    git_log_cmd = [
-        "git", "log", "--all", "--reverse",
-        f"--author={author}",
-        f"--since={since}",
-        "--pretty=format:%h %ad | %s [%d] (%an)",
-        "--date=short"
-    ]
-
-    for folder in folders:
-        if not os.path.isdir(folder):
-            print(f"Folder '{folder}' does not exist or is not accessible.")
-            continue
+    # One immutable argument tuple shared by every worker thread
+    git_log_args = (*_GIT_LOG_STATIC, f"--author={author}", f"--since={since}")
 
-        try:
-            # Run git log command in each specified folder
-            result = subprocess.run(
-                git_log_cmd, cwd=folder, text=True,
-                capture_output=True, check=True
-            )
-            # Store the output in the dictionary, keyed by folder path
-            commit_data[folder] = result.stdout.strip().split('\n') if result.stdout else []
-        
-        except subprocess.CalledProcessError as e:
-            print(f"Error retrieving git log from '{folder}': {e}")
-            commit_data[folder] = []
+    if not folders:
+        return {}
+
+    # Each folder is an independent git process, so run them concurrently;
+    # map() keeps the results in the configured folder order
+    max_workers = min(len(folders), GIT_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda folder: _run_git_log(git_log_args, folder), folders)
+        # Store the output in the dictionary, keyed by folder path
+        return dict(result for result in results if result is not None)
 
-    return commit_data
+def _run_git_log(git_log_args: Tuple[str, ...], folder: str) -> Optional[Tuple[str, List[str]]]:
+    """Run git log in a single folder, returning (folder, commit lines) or None if the folder is missing."""
+    if not os.path.isdir(folder):
+        print(f"Folder '{folder}' does not exist or is not accessible.")
+        return None
+
+    try:
+        # Run git log command against the folder
+        result = subprocess.run(
+            ["git", "-C", folder, *git_log_args], text=True,
+            capture_output=True, check=True
+        )
+        # -z separates commits with NUL, so records can't be split by
+        # newlines inside them; dropping empties gives [] for no output
+        return folder, [record for record in result.stdout.split("\x00") if record]
+
+    except subprocess.CalledProcessError as e:
+        # A failing folder shouldn't affect the others
+        print(f"Error retrieving git log from '{folder}': {e}")
+        return folder, []
 
 def format_git_history(history):
     """Format Git commit history for appending to Vertex AI prompt."""
     if not history:
         return "No Git history found."
 
-    history_info = "Include this Git history:\n"
+    history_info = ["Include this Git history:"]
     for folder, commits in history.items():
-        history_info += f"\nFolder: {folder}\n"
-        for commit in commits:
-            history_info += f"- {commit}\n"
-    return history_info
+        history_info.append(f"\nFolder: {folder}")
+        history_info.extend(f"- {commit}" for commit in commits)
+    return "\n".join(history_info) + "\n"
 
 def get_timew_summary() -> str:
     """Retrieve Timewarrior summary for yesterday."""
@@ -132,16 +272,169 @@ def get_timew_summary() -> str:
         print(f"Error retrieving Timewarrior summary: {e}")
         return "No timewarrior summary available."
 
+def _instruction_cache_model() -> Optional[GenerativeModel]:
+    """Return a model bound to a Vertex context cache of INSTRUCTION, or None if caching is unavailable."""
+    if caching is None:
+        return None
+
+    # A new cache is needed whenever the model or instruction changes
+    digest = hashlib.sha256(f"{MODEL}\n{INSTRUCTION}".encode("utf-8")).hexdigest()
+    state_path = os.path.join(CACHE_DIRECTORY, INSTRUCTION_CACHE_FILE)
+    try:
+        with open(state_path, "r", encoding="utf-8") as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        state = {}
+
+    # Don't retry a failed cache creation on every run
+    if state.get("hash") == digest and state.get("retry_after", 0) > time.time():
+        return None
+
+    # Reuse the stored cache unless it is about to expire or has gone away
+    cached = None
+    if state.get("hash") == digest and state.get("expires_at", 0) > time.time() + 300:
+        try:
+            cached = caching.CachedContent(cached_content_name=state["name"])
+        except Exception:
+            cached = None
+
+    try:
+        if cached is None:
+            cached = caching.CachedContent.create(
+                model_name=MODEL,
+                system_instruction=INSTRUCTION,
+                ttl=INSTRUCTION_CACHE_TTL
+            )
+            os.makedirs(CACHE_DIRECTORY, mode=0o700, exist_ok=True)
+            with open(state_path, "w", encoding="utf-8") as file:
+                json.dump({
+                    "hash": digest,
+                    "name": cached.name,
+                    "expires_at": time.time() + INSTRUCTION_CACHE_TTL.total_seconds()
+                }, file)
+        return GenerativeModel.from_cached_content(cached_content=cached)
+    except Exception as e:
+        # e.g. the instruction is below the minimum cacheable size
+        print(f"Vertex AI context cache unavailable, sending full prompt: {e}")
+        try:
+            os.makedirs(CACHE_DIRECTORY, mode=0o700, exist_ok=True)
+            with open(state_path, "w", encoding="utf-8") as file:
+                json.dump({
+                    "hash": digest,
+                    "retry_after": time.time() + INSTRUCTION_CACHE_TTL.total_seconds()
+                }, file)
+        except OSError:
+            pass
+        return None
+
+def _stream_generate(
+    generative_model: GenerativeModel, prompt: str, chunks: Optional[List[str]] = None
+) -> str:
+    """Generate a response, printing its text as it streams in, and return the full text.
+
+    Text is collected into `chunks` as it arrives, so a caller can tell
+    whether anything was printed before an error.
+    """
+    if chunks is None:
+        chunks = []
+    for response in generative_model.generate_content(prompt, stream=True):
+        try:
+            text = response.text
+        except ValueError:  # chunk without text, e.g. only finish metadata
+            continue
+        chunks.append(text)
+        print(text, end="", flush=True)
+    print()
+    return "".join(chunks).strip()
+
 def summarize_text(content):
-    """Summarize or add context to the combined content of two days' notes using Vertex AI's GenerativeModel."""
+    """Summarize or add context to the combined content of two days' notes using Vertex AI's GenerativeModel.
+
+    The summary is printed as it is generated.
+    """
+    if model is None:
+        print("Vertex AI is not initialized; call load_config() first")
+        return None
+
     try:
+        cached_model = _instruction_cache_model()
+        if cached_model is not None:
+            printed: List[str] = []
+            try:
+                return _stream_generate(cached_model, content, printed)
+            except Exception as e:
+                # Retrying would print a second summary after the partial one
+                if printed:
+                    print()
+                    raise
+                print(f"Error using cached Vertex AI context, retrying with full prompt: {e}")
+
         full_prompt = f"{INSTRUCTION}\n\n{content}"
-        response = model.generate_content(full_prompt)
-        return response.text.strip()
+        return _stream_generate(model, full_prompt)
     except Exception as e:
         print(f"Error during Vertex AI summarization: {e}")
         return None
 
+def _summary_cache_key(content: str) -> str:
+    """Hash everything that determines the generated summary."""
+    return hashlib.sha256(f"{MODEL}\n{INSTRUCTION}\n{content}".encode("utf-8")).hexdigest()
+
+def _summary_cache_cutoff() -> str:
+    """Return the created_at below which cached summaries have expired."""
+    return (datetime.now() - SUMMARY_CACHE_MAX_AGE).isoformat(timespec="seconds")
+
+def _summary_cache_connect() -> sqlite3.Connection:
+    """Open the summary cache database, creating its table if needed."""
+    os.makedirs(CACHE_DIRECTORY, mode=0o700, exist_ok=True)
+    path = os.path.join(CACHE_DIRECTORY, SUMMARY_CACHE_DB)
+    # Create the file owner-only before SQLite opens it
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o600))
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, summary TEXT, created_at TEXT)"
+    )
+    return conn
+
+def get_cached_summary(key: str) -> Optional[str]:
+    """Look up a previously generated summary, or None on a miss or cache error."""
+    try:
+        conn = _summary_cache_connect()
+        try:
+            row = conn.execute(
+                "SELECT summary FROM cache WHERE key = ? AND created_at >= ?",
+                (key, _summary_cache_cutoff())
+            ).fetchone()
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error reading summary cache: {e}")
+        return None
+    return row[0] if row else None
+
+def store_cached_summary(key: str, summary: str) -> None:
+    """Remember a generated summary; failures only cost a future cache miss."""
+    try:
+        conn = _summary_cache_connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM cache WHERE created_at < ?", (_summary_cache_cutoff(),))
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, summary, created_at) VALUES (?, ?, ?)",
+                    (key, summary, datetime.now().isoformat(timespec="seconds"))
+                )
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error writing summary cache: {e}")
+
+def _read_note(path: Path) -> Optional[str]:
+    """Read a notes file in one call, or return None if it doesn't exist."""
+    # Just try to read it; a missing file is the rare case
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
 def process_notes(directory):
     """Read notes for today and the previous workday (handles special case for Monday), combine them, add Jira ticket info and GitHub activity, and summarize the content."""
     today = datetime.now()
@@ -152,47 +445,83 @@ def process_notes(directory):
         # Otherwise, set `previous_workday` to yesterday
         previous_workday = today - timedelta(days=1)
 
-    today_path = os.path.join(directory, today.strftime("%Y"), today.strftime("%m"), f"{today.strftime('%d')}.txt")
-    previous_workday_path = os.path.join(directory, previous_workday.strftime("%Y"), previous_workday.strftime("%m"), f"{previous_workday.strftime('%d')}.txt")
+    today_path = Path(directory, f"{today:%Y/%m/%d}.txt")
+    previous_workday_path = Path(directory, f"{previous_workday:%Y/%m/%d}.txt")
 
-    combined_content = ""
+    # Read the notes first: without them there is nothing worth spending
+    # the Jira call, git processes and Vertex AI request on
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        today_notes, previous_notes = executor.map(_read_note, (today_path, previous_workday_path))
 
-    if os.path.exists(today_path):
-        with open(today_path, "r", encoding="utf-8") as file:
-            combined_content += f"Notes for {today.strftime('%Y-%m-%d')}:\n{file.read()}\n\n"
+    if today_notes is None and previous_notes is None:
+        print("No notes found for today or the previous workday.")
+        return None
+
+    parts = []
+    if today_notes is not None:
+        parts.append(f"Notes for {today:%Y-%m-%d}:\n{today_notes}\n\n")
+    if previous_notes is not None:
+        parts.append(f"Notes for {previous_workday:%Y-%m-%d}:\n{previous_notes}\n\n")
 
-    if os.path.exists(previous_workday_path):
-        with open(previous_workday_path, "r", encoding="utf-8") as file:
-            combined_content += f"Notes for {previous_workday.strftime('%Y-%m-%d')}:\n{file.read()}\n\n"
+    # Jira, git and timewarrior are independent I/O, so fetch them
+    # concurrently and overlap their latency
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        tickets_future = executor.submit(fetch_tickets)
+        git_future = executor.submit(get_git_history, GIT_AUTHOR, GIT_DIRECTORIES, "yesterday")
+        timew_future = executor.submit(get_timew_summary)
 
-    tickets = fetch_tickets()
-    jira_info = format_tickets_for_prompt(tickets)
-    combined_content += jira_info + "\n"
+        tickets = tickets_future.result()
+        jira_info = format_tickets_for_prompt(tickets)
+        parts.append(jira_info + "\n")
 
-    git_history = get_git_history(GIT_AUTHOR, GIT_DIRECTORIES, since="yesterday")
-    git_info = format_git_history(git_history)
-    combined_content += git_info + "\n"
-    timew_summary = get_timew_summary()
-    combined_content += timew_summary + "\n\n"
+        git_history = git_future.result()
+        git_info = format_git_history(git_history)
+        parts.append(git_info + "\n")
+        timew_summary = timew_future.result()
+        parts.append(timew_summary + "\n\n")
 
-    if combined_content:
+    combined_content = "".join(parts)
+
+    print(f"Combined summary for {previous_workday.strftime('%Y-%m-%d')} and {today.strftime('%Y-%m-%d')}:")
+    cache_key = _summary_cache_key(combined_content)
+    summary = get_cached_summary(cache_key)
+    if summary is not None:
+        print(summary)
+    else:
+        # Streams the summary to stdout as it is generated
         summary = summarize_text(combined_content)
         if summary:
-            print(f"Combined summary for {previous_workday.strftime('%Y-%m-%d')} and {today.strftime('%Y-%m-%d')}:\n{summary}")
-            return {"date_range": f"{previous_workday.strftime('%Y-%m-%d')} to {today.strftime('%Y-%m-%d')}", "summary": summary}
-        else:
-            print("Failed to summarize the combined notes")
-            return None
+            store_cached_summary(cache_key, summary)
+    if summary:
+        return {"date_range": f"{previous_workday.strftime('%Y-%m-%d')} to {today.strftime('%Y-%m-%d')}", "summary": summary}
     else:
-        print("No notes found for today or the previous workday.")
+        print("Failed to summarize the combined notes")
         return None
 
-summarized_notes = process_notes(NOTES_DIRECTORY)
+def append_summary(output_path: str, entry: str) -> None:
+    """Append an entry to the output file, reusing one O_APPEND descriptor per file."""
+    fd = _out_fds.get(output_path)
+    if fd is None:
+        fd = os.open(output_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        _out_fds[output_path] = fd
+        atexit.register(os.close, fd)
 
-if summarized_notes:
-    # Define the output file path
-    output_path = os.path.join(OUTPUT_DIRECTORY, "summaries.txt")
-    
-    # Append the summary to the file
-    with open(output_path, "a", encoding="utf-8") as output_file:
-        output_file.write(f"{summarized_notes['date_range']}: {summarized_notes['summary']}\n")
\ No newline at end of file
+    data = entry.encode("utf-8")
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+def main():
+    """Load the configuration, summarize the notes and append the summary to the output file."""
+    load_config()
+    summarized_notes = process_notes(NOTES_DIRECTORY)
+
+    if summarized_notes:
+        # Define the output file path
+        output_path = os.path.join(OUTPUT_DIRECTORY, "summaries.txt")
+
+        # Append the summary to the file
+        append_summary(output_path, f"{summarized_notes['date_range']}: {summarized_notes['summary']}\n")
+
+if __name__ == "__main__":
+    main()